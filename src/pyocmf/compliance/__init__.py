@@ -3,7 +3,11 @@ from pyocmf.compliance.models import (
     IssueCode,
     IssueSeverity,
 )
-from pyocmf.compliance.reading import check_eichrecht_reading
+from pyocmf.compliance.reading import (
+    check_eichrecht_payload,
+    check_eichrecht_reading,
+    has_eichrecht_error,
+)
 from pyocmf.compliance.transaction import (
     check_eichrecht_transaction,
     validate_transaction_pair,
@@ -13,7 +17,9 @@ __all__ = [
     "EichrechtIssue",
     "IssueCode",
     "IssueSeverity",
+    "check_eichrecht_payload",
     "check_eichrecht_reading",
     "check_eichrecht_transaction",
+    "has_eichrecht_error",
     "validate_transaction_pair",
 ]
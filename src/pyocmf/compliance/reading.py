@@ -1,8 +1,15 @@
 from __future__ import annotations
 
+import itertools
+from collections.abc import Iterator
+from typing import TYPE_CHECKING
+
 from pyocmf.compliance.models import EichrechtIssue, IssueCode, IssueSeverity
 from pyocmf.core.reading import Reading
-from pyocmf.enums.reading import MeterStatus, TimeStatus
+from pyocmf.enums.reading import MeterReadingReason, MeterStatus, TimeStatus
+
+if TYPE_CHECKING:
+    from pyocmf.core.payload import Payload
 
 
 def check_eichrecht_reading(reading: Reading, is_begin: bool = False) -> list[EichrechtIssue]:
@@ -16,60 +23,89 @@ def check_eichrecht_reading(reading: Reading, is_begin: bool = False) -> list[Ei
         List of compliance issues (empty if compliant)
 
     """
-    issues: list[EichrechtIssue] = []
+    return list(_iter_reading_issues(reading, is_begin))
+
+
+def check_eichrecht_payload(payload: Payload) -> list[EichrechtIssue]:
+    """Check every reading of a single payload for Eichrecht compliance.
+
+    Only the first reading can be a transaction begin. A payload without
+    readings yields a single NO_READINGS issue.
+
+    Args:
+        payload: The payload to check
+
+    Returns:
+        List of compliance issues (empty if compliant)
+
+    """
+    return list(_iter_payload_issues(payload))
+
 
+def has_eichrecht_error(payload: Payload) -> bool:
+    """Check whether the payload has an Eichrecht error.
+
+    Applies the same rules as check_eichrecht_payload but stops at the first
+    error instead of collecting every issue, which makes it the cheap path for a
+    plain compliant/non-compliant answer. Warnings are ignored.
+    """
+    return any(issue.severity == IssueSeverity.ERROR for issue in _iter_payload_issues(payload))
+
+
+def _iter_payload_issues(payload: Payload) -> Iterator[EichrechtIssue]:
+    readings = payload.RD
+    if not readings:
+        yield EichrechtIssue(
+            code=IssueCode.NO_READINGS,
+            message="No readings (RD) present in payload",
+            field="RD",
+        )
+        return
+
+    first = readings[0]
+    yield from _iter_reading_issues(first, first.TX == MeterReadingReason.BEGIN)
+    for reading in itertools.islice(readings, 1, None):
+        yield from _iter_reading_issues(reading, False)
+
+
+def _iter_reading_issues(reading: Reading, is_begin: bool) -> Iterator[EichrechtIssue]:
     if reading.ST != MeterStatus.OK:
-        issues.append(
-            EichrechtIssue(
-                code=IssueCode.METER_STATUS,
-                message=(
-                    f"Meter status must be 'G' (OK) for billing-relevant readings, "
-                    f"got '{reading.ST}'"
-                ),
-                field="ST",
-            )
+        yield EichrechtIssue(
+            code=IssueCode.METER_STATUS,
+            message=(
+                f"Meter status must be 'G' (OK) for billing-relevant readings, got '{reading.ST}'"
+            ),
+            field="ST",
         )
 
     if reading.EF and reading.EF.strip():
-        issues.append(
-            EichrechtIssue(
-                code=IssueCode.ERROR_FLAGS,
-                message=(
-                    f"Error flags must be empty for billing-relevant readings, got '{reading.EF}'"
-                ),
-                field="EF",
-            )
+        yield EichrechtIssue(
+            code=IssueCode.ERROR_FLAGS,
+            message=f"Error flags must be empty for billing-relevant readings, got '{reading.EF}'",
+            field="EF",
         )
 
     if reading.time_status != TimeStatus.SYNCHRONIZED:
-        issues.append(
-            EichrechtIssue(
-                code=IssueCode.TIME_SYNC,
-                message=(
-                    f"Time should be synchronized (status 'S') for billing, "
-                    f"got '{reading.time_status.value}'"
-                ),
-                field="TM",
-                severity=IssueSeverity.WARNING,
-            )
+        yield EichrechtIssue(
+            code=IssueCode.TIME_SYNC,
+            message=(
+                f"Time should be synchronized (status 'S') for billing, "
+                f"got '{reading.time_status.value}'"
+            ),
+            field="TM",
+            severity=IssueSeverity.WARNING,
         )
 
     if reading.CL is not None:
         if is_begin and reading.CL != 0:
-            issues.append(
-                EichrechtIssue(
-                    code=IssueCode.CL_BEGIN,
-                    message=f"Cumulated loss (CL) must be 0 at transaction begin, got {reading.CL}",
-                    field="CL",
-                )
+            yield EichrechtIssue(
+                code=IssueCode.CL_BEGIN,
+                message=f"Cumulated loss (CL) must be 0 at transaction begin, got {reading.CL}",
+                field="CL",
             )
         if reading.CL < 0:
-            issues.append(
-                EichrechtIssue(
-                    code=IssueCode.CL_NEGATIVE,
-                    message=f"Cumulated loss (CL) must be non-negative, got {reading.CL}",
-                    field="CL",
-                )
+            yield EichrechtIssue(
+                code=IssueCode.CL_NEGATIVE,
+                message=f"Cumulated loss (CL) must be non-negative, got {reading.CL}",
+                field="CL",
             )
-
-    return issues
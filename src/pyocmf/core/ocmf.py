@@ -2,17 +2,20 @@ from __future__ import annotations
 
 import decimal
 import json
-from typing import Literal
+import string
+from typing import ClassVar, Literal
 
 import pydantic
 
+# Module reference rather than direct imports: pyocmf.compliance imports
+# pyocmf.core, so its functions are resolved at call time
 from pyocmf import compliance
 from pyocmf.compliance.models import EichrechtIssue, IssueSeverity
 from pyocmf.constants import OCMF_HEADER, OCMF_PREFIX, OCMF_SEPARATOR
 from pyocmf.core.payload import Payload
 from pyocmf.core.signature import Signature
-from pyocmf.crypto import verification
-from pyocmf.enums.reading import MeterReadingReason
+from pyocmf.crypto.verification import Verifier
+from pyocmf.crypto.verification import verify_signature as _verify_signature
 from pyocmf.exceptions import (
     HexDecodingError,
     OcmfFormatError,
@@ -21,29 +24,80 @@ from pyocmf.exceptions import (
     SignatureVerificationError,
 )
 from pyocmf.models.public_key import PublicKey
-from pyocmf.utils.serialization import model_to_ocmf_json
+from pyocmf.utils.serialization import flat_dict_to_ocmf_json, model_to_ocmf_json
+
+# Deletes every character bytes.fromhex accepts, so a non-empty result means the
+# input cannot be hex-encoded OCMF and the decode attempt can be skipped
+_HEX_DELETE_TABLE = str.maketrans("", "", string.hexdigits + string.whitespace)
+_MIN_HEX_LENGTH = 2 * len(OCMF_PREFIX)
+_OCMF_PREFIX_BYTES = OCMF_PREFIX.encode("ascii")
+
+_FORMAT_ERROR_MSG = (
+    f"String does not match expected OCMF format "
+    f"'{OCMF_HEADER}{OCMF_SEPARATOR}{{payload}}{OCMF_SEPARATOR}{{signature}}'."
+)
+
+# parse_float=Decimal builds Decimals from the raw JSON literals, preserving decimal
+# places (e.g. 2935.600) that pydantic's own JSON parser would drop. json.loads with
+# custom arguments would build a fresh decoder on every call, so one is shared.
+_PAYLOAD_JSON_DECODER = json.JSONDecoder(parse_float=decimal.Decimal)
 
 
 class OCMF(pydantic.BaseModel):
     """OCMF data model with three pipe-separated sections: header, payload, and signature."""
 
+    # The sections must not be swapped after parsing: signature verification
+    # relies on the original payload JSON kept alongside them
+    model_config = pydantic.ConfigDict(frozen=True, extra="forbid")
+
     header: Literal["OCMF"]
     payload: Payload
     signature: Signature
-    _original_payload_json: str | None = pydantic.PrivateAttr(default=None)
+    _original_payload_bytes: bytes | None = pydantic.PrivateAttr(default=None)
+
+    # Upper bound on the raw input length accepted by from_string; real OCMF
+    # records are a few kilobytes, so larger inputs are rejected before parsing
+    MAX_OCMF_LEN: ClassVar[int] = 1 << 20
 
     @classmethod
-    def from_string(cls, ocmf_string: str) -> OCMF:
+    def from_string(cls, ocmf_string: str, *, validate: bool = True) -> OCMF:
         """Parse an OCMF string into an OCMF model.
 
         Automatically detects whether the input is plain text (starts with "OCMF|")
-        or hex-encoded and handles both formats.
+        or hex-encoded and handles both formats. Inputs longer than MAX_OCMF_LEN
+        characters are rejected with OcmfFormatError.
+
+        With validate=False the payload and readings skip their validators (see
+        Payload.from_flat_dict). Only use it for data that is already known to be
+        valid, e.g. records re-loaded after their signature was verified.
         """
-        ocmf_text = ocmf_string.strip()
+        if len(ocmf_string) > cls.MAX_OCMF_LEN:
+            msg = (
+                f"OCMF string is too long: {len(ocmf_string)} characters exceeds the "
+                f"limit of {cls.MAX_OCMF_LEN}"
+            )
+            raise OcmfFormatError(msg)
 
-        if not ocmf_text.startswith(OCMF_PREFIX):
+        ocmf_text = ocmf_string.lstrip()
+
+        if ocmf_text.startswith(OCMF_PREFIX):
+            ocmf_text = ocmf_text.rstrip()
+        else:
+            # bytes.fromhex skips ASCII whitespace itself, so the hex input is
+            # decoded as given instead of being stripped into a copy first
+            if ocmf_text.translate(_HEX_DELETE_TABLE):
+                msg = (
+                    f"Invalid OCMF string: must start with '{OCMF_PREFIX}' or be valid hex-encoded."
+                )
+                raise HexDecodingError(msg)
+            # Valid hex too short to hold the prefix cannot be an OCMF string
+            if len(ocmf_text) < _MIN_HEX_LENGTH:
+                raise OcmfFormatError(_FORMAT_ERROR_MSG)
             try:
-                decoded_bytes = bytes.fromhex(ocmf_text)
+                decoded_bytes = bytes.fromhex(ocmf_string)
+                # Checked on the raw bytes so non-OCMF blobs are never decoded to str
+                if not decoded_bytes.startswith(_OCMF_PREFIX_BYTES):
+                    raise OcmfFormatError(_FORMAT_ERROR_MSG)
                 ocmf_text = decoded_bytes.decode("utf-8")
             except ValueError as e:
                 msg = (
@@ -54,20 +108,18 @@ class OCMF(pydantic.BaseModel):
         parts = ocmf_text.split(OCMF_SEPARATOR, 2)
 
         if len(parts) != 3 or parts[0] != OCMF_HEADER:
-            msg = (
-                f"String does not match expected OCMF format "
-                f"'{OCMF_HEADER}{OCMF_SEPARATOR}{{payload}}{OCMF_SEPARATOR}{{signature}}'."
-            )
-            raise OcmfFormatError(msg)
+            raise OcmfFormatError(_FORMAT_ERROR_MSG)
 
         payload_json = parts[1]
         signature_json = parts[2]
 
-        # parse_float=Decimal builds Decimals from the raw JSON literals, preserving
-        # decimal places (e.g. 2935.600) that pydantic's own JSON parser would drop
         try:
-            payload = Payload.model_validate(json.loads(payload_json, parse_float=decimal.Decimal))
-        except (json.JSONDecodeError, pydantic.ValidationError) as e:
+            payload = Payload.from_flat_dict(
+                _PAYLOAD_JSON_DECODER.decode(payload_json), validate=validate
+            )
+        except (TypeError, ValueError, KeyError) as e:
+            # ValueError covers JSONDecodeError and pydantic.ValidationError; the
+            # others come from malformed values on the validate=False path
             msg = f"Invalid payload JSON: {e}"
             raise OcmfPayloadError(msg) from e
 
@@ -77,21 +129,28 @@ class OCMF(pydantic.BaseModel):
             msg = f"Invalid signature JSON: {e}"
             raise OcmfSignatureError(msg) from e
 
-        ocmf = cls(header=OCMF_HEADER, payload=payload, signature=signature)
-        ocmf._original_payload_json = payload_json
-        return ocmf
+        # The sections are already validated models; model_construct also sets the
+        # private attributes, which the frozen model does not allow assigning later.
+        # The payload is kept encoded, as signature verification needs its exact bytes.
+        return cls.model_construct(
+            header=OCMF_HEADER,
+            payload=payload,
+            signature=signature,
+            _original_payload_bytes=payload_json.encode("utf-8"),
+        )
 
     def to_string(self, hex: bool = False) -> str:
         """Convert the OCMF model to string format "OCMF|{payload}|{signature}".
 
         Set hex=True to return hex-encoded string instead of plain text.
         """
-        payload_json = model_to_ocmf_json(self.payload)
+        payload_json = flat_dict_to_ocmf_json(self.payload.to_flat_dict())
         signature_json = model_to_ocmf_json(self.signature)
-        ocmf_string = OCMF_SEPARATOR.join([OCMF_HEADER, payload_json, signature_json])
+        ocmf_string = f"{OCMF_PREFIX}{payload_json}{OCMF_SEPARATOR}{signature_json}"
 
         if hex:
-            return ocmf_string.encode("utf-8").hex()
+            # The OCMF JSON encoder escapes non-ASCII characters, so the output is pure ASCII
+            return ocmf_string.encode("ascii").hex()
         return ocmf_string
 
     def verify_signature(self, public_key: PublicKey | str) -> bool:
@@ -101,21 +160,37 @@ class OCMF(pydantic.BaseModel):
         Requires that the OCMF was parsed from a string (not constructed programmatically)
         because signature verification needs the exact original payload bytes.
         """
-        if self._original_payload_json is None:
+        return _verify_signature(
+            payload_json=self._require_original_payload_bytes(),
+            signature_data=self.signature.SD,
+            signature_method=self.signature.SA,
+            signature_encoding=self.signature.SE,
+            public_key_hex=public_key.key if isinstance(public_key, PublicKey) else public_key,
+        )
+
+    def verify_signature_with(self, verifier: Verifier) -> bool:
+        """Verify the cryptographic signature using a prebuilt verifier.
+
+        Same as verify_signature, but reuses a public key already parsed by
+        verification.build_verifier(), which avoids re-parsing the key when many
+        OCMF records signed with the same key are checked.
+        """
+        return verifier.verify(
+            payload_json=self._require_original_payload_bytes(),
+            signature_data=self.signature.SD,
+            signature_method=self.signature.SA,
+            signature_encoding=self.signature.SE,
+        )
+
+    def _require_original_payload_bytes(self) -> bytes:
+        if self._original_payload_bytes is None:
             msg = (
                 "Cannot verify signature: original payload JSON not available. "
                 "Signature verification requires the exact original payload bytes. "
                 "Use OCMF.from_string() to parse OCMF data for signature verification."
             )
             raise SignatureVerificationError(msg)
-
-        return verification.verify_signature(
-            payload_json=self._original_payload_json,
-            signature_data=self.signature.SD,
-            signature_method=self.signature.SA,
-            signature_encoding=self.signature.SE,
-            public_key_hex=public_key.key if isinstance(public_key, PublicKey) else public_key,
-        )
+        return self._original_payload_bytes
 
     def check_eichrecht(
         self, other: OCMF | None = None, *, errors_only: bool = False
@@ -129,22 +204,7 @@ class OCMF(pydantic.BaseModel):
         Set errors_only=True to filter out warnings.
         """
         if other is None:
-            if not self.payload.RD:
-                return [
-                    EichrechtIssue(
-                        code=compliance.IssueCode.NO_READINGS,
-                        message="No readings (RD) present in payload",
-                        field="RD",
-                    )
-                ]
-
-            issues = []
-            for i, reading in enumerate(self.payload.RD):
-                reading_issues = compliance.check_eichrecht_reading(
-                    reading,
-                    is_begin=(i == 0 and reading.TX == MeterReadingReason.BEGIN),
-                )
-                issues.extend(reading_issues)
+            issues = compliance.check_eichrecht_payload(self.payload)
         else:
             issues = compliance.check_eichrecht_transaction(self.payload, other.payload)
 
@@ -155,8 +215,7 @@ class OCMF(pydantic.BaseModel):
 
     @property
     def is_eichrecht_compliant(self) -> bool:
-        issues = self.check_eichrecht(errors_only=True)
-        return len(issues) == 0
+        return not compliance.has_eichrecht_error(self.payload)
 
     def verify(
         self,
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 import decimal
+import functools
 import warnings
-from typing import ClassVar
+from typing import Any, ClassVar, get_args
 
 import pydantic
 
@@ -13,6 +14,7 @@ from pyocmf.enums.identifiers import (
     IdentificationType,
     UserAssignmentStatus,
 )
+from pyocmf.enums.units import ResistanceUnit
 from pyocmf.exceptions import ValidationError
 from pyocmf.models.cable_loss import CableLossCompensation
 from pyocmf.types.identifiers import (
@@ -26,10 +28,15 @@ from pyocmf.types.identifiers import (
     IdentificationData,
     PaginationString,
 )
+from pyocmf.types.numbers import to_ocmf_number
+
+# Reading fields that may be omitted when unchanged from the previous reading
+_INHERITABLE_FIELDS = ("TM", "TX", "RI", "RU", "RT", "EF", "ST")
+_INHERITABLE_FIELD_SET = frozenset(_INHERITABLE_FIELDS)
 
 
 class Payload(pydantic.BaseModel):
-    model_config = pydantic.ConfigDict(extra="allow")
+    model_config = pydantic.ConfigDict(extra="allow", frozen=True)
 
     FV: str | None = pydantic.Field(default=None, description="Format Version")
     GI: str | None = pydantic.Field(default=None, description="Gateway Identification")
@@ -83,26 +90,68 @@ class Payload(pydantic.BaseModel):
         if not readings_data:
             return data
 
-        if readings_data and isinstance(readings_data[0], Reading):
+        # Reading instances need no inheritance, and malformed RD values are left
+        # for field validation to reject
+        if not isinstance(readings_data, list) or not all(
+            isinstance(rd, dict) for rd in readings_data
+        ):
+            return data
+
+        inherited = _inherit_reading_fields(readings_data)
+        if inherited is readings_data:
             return data
 
-        inheritable_fields = ["TM", "TX", "RI", "RU", "RT", "EF", "ST"]
-        last_values: dict[str, str] = {}
-        processed_readings = []
+        return {**data, "RD": inherited}
+
+    @classmethod
+    def from_flat_dict(cls, data: dict, *, validate: bool = True) -> Payload:
+        """Build a Payload from a decoded OCMF payload JSON object.
+
+        Readings that omit fields inherit them from the previous reading. With
+        validate=False no validators run: raw JSON values are only converted to
+        their field types, readings via Reading.from_trusted_dict and the payload
+        via model_construct. This is much faster but only safe for data that
+        was validated before.
+        """
+        if validate:
+            return cls.model_validate(data)
+
+        values = _trusted_payload_values(data)
+        values["RD"] = [
+            Reading.from_trusted_dict(reading_dict)
+            for reading_dict in _inherit_reading_fields(data["RD"])
+        ]
+        return cls._construct_unchecked(**values)
 
-        for rd in readings_data:
-            reading_dict = {
-                field: rd.get(field, last_values.get(field))
-                for field in inheritable_fields
-                if field in rd or field in last_values
-            }
-            reading_dict.update({k: v for k, v in rd.items() if k not in inheritable_fields})
+    @classmethod
+    def _construct_unchecked(cls, **values: Any) -> Payload:
+        """Build a Payload from values that already have their field types.
 
-            last_values.update({k: v for k, v in reading_dict.items() if k in inheritable_fields})
+        Uses model_construct, so none of the field or model validators run. The
+        caller is responsible for every constraint they would enforce, such as
+        GS or MS being present and ID matching the format of IT.
+        """
+        return cls.model_construct(**values)
 
-            processed_readings.append(reading_dict)
+    def to_flat_dict(self) -> dict:
+        """Return the payload as a flat OCMF JSON object without unset fields.
 
-        return {**data, "RD": processed_readings}
+        Produces the same result as model_dump(exclude_none=True) by walking the
+        field values directly instead of going through the pydantic serializer.
+        Timestamps and OBIS codes become strings, numbers stay Decimal and enums
+        are kept as members. Nested extension values are not copied.
+        """
+        data = {field: value for field, value in self.__dict__.items() if value is not None}
+        # Reassigning existing keys keeps the field order of the dump
+        data["RD"] = list(map(Reading.to_flat_dict, self.RD))
+        data["IF"] = list(self.IF)
+        if self.LC is not None:
+            data["LC"] = self.LC.model_dump(exclude_none=True)
+
+        extra = self.__pydantic_extra__
+        if extra:
+            data.update((k, v) for k, v in extra.items() if v is not None)
+        return data
 
     @pydantic.model_validator(mode="after")
     def validate_serial_numbers(self) -> Payload:
@@ -126,14 +175,19 @@ class Payload(pydantic.BaseModel):
     @pydantic.field_validator("CT", mode="before")
     @classmethod
     def convert_ct_empty_to_none(cls, v: str | int | None) -> str | None:
-        if v == "" or v == 0:
+        # Strings, the usual case, need only a truthiness test
+        if isinstance(v, str):
+            return v or None
+        if v == 0:
             return None
         if isinstance(v, int):
             return str(v)
         return v
 
     # ClassVar keeps these lookup tables out of pydantic's private attributes,
-    # which would otherwise be deep-copied per instance and break model equality
+    # which would otherwise be deep-copied per instance and break model equality.
+    # Identification types not listed here (LOCAL, CENTRAL, KEY_CODE, NONE, ...)
+    # accept any string value without validation.
     _ID_FORMAT_VALIDATORS: ClassVar[dict[str, object]] = {
         IdentificationType.ISO14443.value: ISO14443,
         IdentificationType.ISO15693.value: ISO15693,
@@ -144,26 +198,11 @@ class Payload(pydantic.BaseModel):
         IdentificationType.PHONE_NUMBER.value: PHONE_NUMBER,
     }
 
-    # Types that accept any string value without validation
-    _UNRESTRICTED_TYPES: ClassVar[set[str]] = {
-        IdentificationType.LOCAL.value,
-        IdentificationType.LOCAL_1.value,
-        IdentificationType.LOCAL_2.value,
-        IdentificationType.CENTRAL.value,
-        IdentificationType.CENTRAL_1.value,
-        IdentificationType.CENTRAL_2.value,
-        IdentificationType.CARD_TXN_NR.value,
-        IdentificationType.KEY_CODE.value,
-        IdentificationType.UNDEFINED.value,
-        IdentificationType.NONE.value,
-        IdentificationType.DENIED.value,
-    }
-
     # Types that validate with warnings instead of errors (permissive mode)
-    _PERMISSIVE_TYPES: ClassVar[set[str]] = {
+    _PERMISSIVE_TYPES: ClassVar[frozenset[str]] = frozenset({
         IdentificationType.ISO14443.value,
         IdentificationType.ISO15693.value,
-    }
+    })
 
     def _validate_id_format(self, it_value: str, id_value: str, *, strict: bool = True) -> None:
         """Validate ID format, either strictly (raise) or permissively (warn).
@@ -174,11 +213,8 @@ class Payload(pydantic.BaseModel):
             strict: If True, raise ValidationError on mismatch. If False, emit warning.
 
         """
-        if it_value not in self._ID_FORMAT_VALIDATORS:
-            return
-
         try:
-            pydantic.TypeAdapter(self._ID_FORMAT_VALIDATORS[it_value]).validate_python(id_value)
+            _check_id_format(it_value, id_value)
         except pydantic.ValidationError as e:
             msg = (
                 f"ID value '{id_value}' does not match expected format for identification "
@@ -204,16 +240,86 @@ class Payload(pydantic.BaseModel):
         For ISO14443 and ISO15693, validation emits warnings but allows non-standard formats,
         as real-world RFID cards may have vendor-specific implementations.
         """
-        if not self.ID or not self.IT:
-            return self
-
-        it_value = self.IT.value if isinstance(self.IT, IdentificationType) else str(self.IT)
-        id_value = self.ID
-
-        if it_value in self._UNRESTRICTED_TYPES:
+        # IdentificationType is a StrEnum, so members hash, compare and format like
+        # their values and are used for the lookups below without conversion
+        it = self.IT
+        if not self.ID or it not in self._ID_FORMAT_VALIDATORS:
             return self
 
         # Use permissive validation (warn) for ISO types, strict for others
-        strict = it_value not in self._PERMISSIVE_TYPES
-        self._validate_id_format(it_value, id_value, strict=strict)
+        self._validate_id_format(it, self.ID, strict=it not in self._PERMISSIVE_TYPES)
         return self
+
+
+@functools.cache
+def _id_format_adapter(it_value: str) -> pydantic.TypeAdapter[str] | None:
+    # Built on first use: constructing a TypeAdapter compiles a full validator, and
+    # most identification types never occur in a given run
+    id_format = Payload._ID_FORMAT_VALIDATORS.get(it_value)
+    if id_format is None:
+        return None
+    return pydantic.TypeAdapter(id_format)
+
+
+@functools.lru_cache(maxsize=1024)
+def _check_id_format(it_value: str, id_value: str) -> None:
+    # lru_cache does not store exceptions, so only IDs that passed are remembered;
+    # records from the same card or contract then skip the format check
+    adapter = _id_format_adapter(it_value)
+    if adapter is not None:
+        adapter.validate_python(id_value)
+
+
+_IDENTIFICATION_FLAGS_BY_VALUE = {
+    flag.value: flag for flag_type in get_args(IdentificationFlag) for flag in flag_type
+}
+
+
+def _trusted_payload_values(data: dict) -> dict:
+    # Only converts types; malformed values raise TypeError, KeyError or ValueError
+    if not isinstance(data, dict):
+        msg = f"payload must be a JSON object, got {type(data).__name__}"
+        raise TypeError(msg)
+    missing = [field for field in ("PG", "IS", "RD") if field not in data]
+    if missing:
+        msg = f"payload is missing required fields: {', '.join(missing)}"
+        raise ValueError(msg)
+    if not isinstance(data["RD"], list) or not all(isinstance(rd, dict) for rd in data["RD"]):
+        msg = "RD must be a JSON array of reading objects"
+        raise TypeError(msg)
+    values = dict(data)
+    values["FV"] = Payload.convert_fv_to_string(values.get("FV"))
+    values["CT"] = Payload.convert_ct_empty_to_none(values.get("CT"))
+    if (il := values.get("IL")) is not None:
+        values["IL"] = UserAssignmentStatus(il)
+    if (it := values.get("IT")) is not None:
+        values["IT"] = IdentificationType(it)
+    if "IF" in values:
+        if not isinstance(values["IF"], list):
+            msg = f"IF must be a JSON array, got {type(values['IF']).__name__}"
+            raise TypeError(msg)
+        values["IF"] = [_IDENTIFICATION_FLAGS_BY_VALUE[flag] for flag in values["IF"]]
+    if (lc := values.get("LC")) is not None:
+        lc = dict(lc)
+        lc["LR"] = to_ocmf_number(lc["LR"])
+        lc["LU"] = ResistanceUnit(lc["LU"])
+        values["LC"] = CableLossCompensation.model_construct(**lc)
+    return values
+
+
+def _inherit_reading_fields(readings_data: list[dict]) -> list[dict]:
+    # Readings from conformant encoders usually repeat every field; hand those back as-is
+    if all(rd.keys() >= _INHERITABLE_FIELD_SET for rd in readings_data):
+        return readings_data
+
+    last_values: dict[str, str] = {}
+    processed_readings = []
+
+    for rd in readings_data:
+        for field, value in rd.items():
+            if field in _INHERITABLE_FIELD_SET:
+                last_values[field] = value
+        # The reading's own values win; missing fields come from earlier readings
+        processed_readings.append(last_values | rd)
+
+    return processed_readings
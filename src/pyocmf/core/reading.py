@@ -15,11 +15,12 @@ from pyocmf.enums.reading import (
 from pyocmf.enums.units import EnergyUnit, OCMFUnit, ResistanceUnit
 from pyocmf.models.obis import OBIS, OBISCode
 from pyocmf.models.timestamp import OCMFTimestamp
-from pyocmf.registries.obis import is_accumulation_register
-from pyocmf.types.numbers import OCMFNumber
+from pyocmf.types.numbers import OCMFNumber, to_ocmf_number
 
 
 class Reading(pydantic.BaseModel):
+    model_config = pydantic.ConfigDict(frozen=True)
+
     TM: OCMFTimestamp = pydantic.Field(description="Time (ISO 8601 + time status) - REQUIRED")
     TX: MeterReadingReason | None = pydantic.Field(default=None, description="Transaction")
     RV: OCMFNumber | None = pydantic.Field(
@@ -90,23 +91,19 @@ class Reading(pydantic.BaseModel):
         if v is None:
             return v
 
-        ri = info.data.get("RI")
+        data = info.data
+        ri = data.get("RI")
         cl_register_error = (
             "CL (Cumulated Loss) can only appear when RI indicates an "
             "accumulation register (B0-B3, C0-C3)"
         )
-        if not ri:
-            raise ValueError(cl_register_error)
-        if isinstance(ri, OBIS) and not ri.is_accumulation_register:
-            raise ValueError(cl_register_error)
-        if isinstance(ri, str) and not is_accumulation_register(ri):
+        # RI is validated before CL, so it is either a parsed OBIS or missing
+        if not ri or not ri.is_accumulation_register:
             raise ValueError(cl_register_error)
 
-        if v != 0:
-            tx = info.data.get("TX")
-            if tx == MeterReadingReason.BEGIN:
-                msg = "CL (Cumulated Loss) must be 0 when TX=B (transaction begin)"
-                raise ValueError(msg)
+        if v != 0 and data.get("TX") == MeterReadingReason.BEGIN:
+            msg = "CL (Cumulated Loss) must be 0 when TX=B (transaction begin)"
+            raise ValueError(msg)
 
         if v < 0:
             msg = "CL (Cumulated Loss) must be non-negative"
@@ -137,6 +134,59 @@ class Reading(pydantic.BaseModel):
 
         return self
 
+    @classmethod
+    def from_trusted_dict(cls, data: dict) -> Reading:
+        """Build a Reading from already-validated data without running validators.
+
+        Raw JSON values are only converted to their field types (timestamp, OBIS
+        code, enums, numbers); constraint checks such as the CL and RI/RU rules are
+        skipped. Only use this for data that passed validation before, e.g. OCMF
+        records whose signature was already verified.
+
+        Malformed values still raise TypeError or ValueError instead of producing
+        a Reading with wrong field types.
+        """
+        if not isinstance(data, dict):
+            msg = f"reading must be a JSON object, got {type(data).__name__}"
+            raise TypeError(msg)
+        missing = [field for field in ("TM", "ST") if field not in data]
+        if missing:
+            msg = f"reading is missing required fields: {', '.join(missing)}"
+            raise ValueError(msg)
+        values = dict(data)
+        tm = values["TM"]
+        if isinstance(tm, str):
+            values["TM"] = OCMFTimestamp.from_string(tm)
+        elif not isinstance(tm, OCMFTimestamp):
+            msg = f"TM must be a string, got {type(tm).__name__}"
+            raise TypeError(msg)
+        ri = values.get("RI")
+        if isinstance(ri, str):
+            values["RI"] = OBIS.from_string(ri)
+        elif ri is not None and not isinstance(ri, OBIS):
+            msg = f"RI must be a string, got {type(ri).__name__}"
+            raise TypeError(msg)
+        for field, enum_type, members in _ENUM_FIELDS:
+            if (value := values.get(field)) is not None:
+                values[field] = members.get(value) or enum_type(value)
+        for field in ("RV", "CL"):
+            if (value := values.get(field)) is not None:
+                values[field] = to_ocmf_number(value)
+        if values.get("EF") == "":
+            values["EF"] = None
+        return cls.model_construct(**values)
+
+    def to_flat_dict(self) -> dict:
+        """Return the reading as a flat OCMF JSON object without unset fields.
+
+        Same result as model_dump(exclude_none=True), see Payload.to_flat_dict.
+        """
+        data = {field: value for field, value in self.__dict__.items() if value is not None}
+        data["TM"] = str(self.TM)
+        if self.RI is not None:
+            data["RI"] = str(self.RI)
+        return data
+
     @property
     def timestamp(self):
         return self.TM.timestamp
@@ -144,3 +194,10 @@ class Reading(pydantic.BaseModel):
     @property
     def time_status(self) -> TimeStatus:
         return self.TM.status
+
+
+# (field, enum, members by value); the dict lookup avoids calling the enum class
+_ENUM_FIELDS = tuple(
+    (field, enum_type, {member.value: member for member in enum_type})
+    for field, enum_type in (("TX", MeterReadingReason), ("RT", ReadingType), ("ST", MeterStatus))
+)
@@ -1,3 +1,7 @@
+from __future__ import annotations
+
+from typing import Annotated
+
 import pydantic
 
 from pyocmf.enums.crypto import (
@@ -5,9 +9,21 @@ from pyocmf.enums.crypto import (
     SignatureMethod,
     SignatureMimeType,
 )
-from pyocmf.types.encoding import Base64Str, HexStr
+from pyocmf.exceptions import EncodingError
+from pyocmf.types.encoding import validate_base64_string, validate_hex_string
 
-SignatureDataType = HexStr | Base64Str
+SignatureDataType = Annotated[
+    str,
+    pydantic.WithJsonSchema(
+        {
+            "anyOf": [
+                {"type": "string", "pattern": "^[0-9a-fA-F]+$"},
+                {"type": "string", "format": "base64"},
+            ]
+        },
+        mode="validation",
+    ),
+]
 
 
 class Signature(pydantic.BaseModel):
@@ -25,3 +41,25 @@ class Signature(pydantic.BaseModel):
         default=SignatureMimeType.APPLICATION_X_DER, description="Signature Mime Type"
     )
     SD: SignatureDataType = pydantic.Field(description="Signature Data")
+
+    @pydantic.field_validator("SD")
+    @classmethod
+    def validate_sd_encoding(cls, v: str, info: pydantic.ValidationInfo) -> str:
+        """Check SD against the encoding SE declares first (hex if SE is missing).
+
+        SD in the other encoding is still accepted, as it was before SE was
+        consulted; the declared encoding's error is raised if neither matches.
+        """
+        # SE is declared before SD, so it is already validated (or missing)
+        if info.data.get("SE") == SignatureEncodingType.BASE64:
+            declared, other = validate_base64_string, validate_hex_string
+        else:
+            declared, other = validate_hex_string, validate_base64_string
+        try:
+            declared(v)
+        except EncodingError as declared_error:
+            try:
+                other(v)
+            except EncodingError:
+                raise declared_error from None
+        return v
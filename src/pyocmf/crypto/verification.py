@@ -1,17 +1,36 @@
 from __future__ import annotations
 
 import base64
+import functools
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
 
 from pyocmf.crypto.availability import (
+    CRYPTOGRAPHY_AVAILABLE,
     InvalidSignature,
     check_cryptography_available,
     ec,
     hashes,
-    serialization,
 )
 from pyocmf.enums.crypto import HashAlgorithm, SignatureEncodingType, SignatureMethod
 from pyocmf.exceptions import EncodingError, PublicKeyError, SignatureVerificationError
 
+if TYPE_CHECKING:
+    from pyocmf.core.ocmf import OCMF
+    from pyocmf.models.public_key import PublicKey
+
+_HASH_CLASSES: dict[HashAlgorithm, type[hashes.HashAlgorithm]] = (
+    {HashAlgorithm.SHA256: hashes.SHA256, HashAlgorithm.SHA512: hashes.SHA512}
+    if CRYPTOGRAPHY_AVAILABLE
+    else {}
+)
+
+# ECDSA signature algorithm objects are stateless, so one per hash is shared by all checks
+_ECDSA_ALGORITHMS: dict[type[hashes.HashAlgorithm], ec.ECDSA] = {
+    hash_class: ec.ECDSA(hash_class()) for hash_class in _HASH_CLASSES.values()
+}
+
 
 def get_hash_algorithm(signature_method: SignatureMethod | None) -> type[hashes.HashAlgorithm]:
     check_cryptography_available()
@@ -20,12 +39,7 @@ def get_hash_algorithm(signature_method: SignatureMethod | None) -> type[hashes.
         msg = "Signature algorithm (SA) is required for verification"
         raise SignatureVerificationError(msg)
 
-    hash_mapping: dict[HashAlgorithm, type[hashes.HashAlgorithm]] = {
-        HashAlgorithm.SHA256: hashes.SHA256,
-        HashAlgorithm.SHA512: hashes.SHA512,
-    }
-
-    hash_class = hash_mapping.get(signature_method.hash_algorithm)
+    hash_class = _HASH_CLASSES.get(signature_method.hash_algorithm)
     if hash_class is None:
         msg = f"Unsupported hash algorithm in signature method: {signature_method}"
         raise SignatureVerificationError(msg)
@@ -33,26 +47,110 @@ def get_hash_algorithm(signature_method: SignatureMethod | None) -> type[hashes.
     return hash_class
 
 
+# SE defaults to hex when omitted
+_SIGNATURE_DECODERS: dict[SignatureEncodingType | None, tuple[Callable[[str], bytes], str]] = {
+    SignatureEncodingType.HEX: (bytes.fromhex, "hex"),
+    SignatureEncodingType.BASE64: (base64.b64decode, "base64"),
+    None: (bytes.fromhex, "hex"),
+}
+
+
+@functools.lru_cache(maxsize=1024)
 def decode_signature_data(signature_data: str, encoding: SignatureEncodingType | None) -> bytes:
-    if encoding == SignatureEncodingType.HEX or encoding is None:
-        try:
-            return bytes.fromhex(signature_data)
-        except ValueError as e:
-            msg = f"Failed to decode hex signature data: {e}"
-            raise SignatureVerificationError(msg) from e
-    elif encoding == SignatureEncodingType.BASE64:
-        try:
-            return base64.b64decode(signature_data)
-        except Exception as e:
-            msg = f"Failed to decode base64 signature data: {e}"
-            raise SignatureVerificationError(msg) from e
-    else:
+    # Cached so checking one record against several candidate keys decodes SD once
+    decoder = _SIGNATURE_DECODERS.get(encoding)
+    if decoder is None:
         msg = f"Unsupported signature encoding: {encoding}"
         raise SignatureVerificationError(msg)
 
+    decode, encoding_name = decoder
+    try:
+        return decode(signature_data)
+    except ValueError as e:
+        # binascii.Error from b64decode is a ValueError subclass
+        msg = f"Failed to decode {encoding_name} signature data: {e}"
+        raise SignatureVerificationError(msg) from e
+
+
+class Verifier:
+    """Reusable signature verifier bound to a single parsed public key.
+
+    Build one with build_verifier() and reuse it to check many OCMF records
+    signed with the same key, so the key is parsed only once.
+    """
+
+    def __init__(self, public_key: PublicKey, crypto_public_key: ec.EllipticCurvePublicKey) -> None:
+        self.public_key = public_key
+        self._crypto_public_key = crypto_public_key
+
+    def verify(
+        self,
+        payload_json: str | bytes,
+        signature_data: str,
+        signature_method: SignatureMethod | None,
+        signature_encoding: SignatureEncodingType | None,
+    ) -> bool:
+        """Verify ECDSA signature against payload using the bound public key.
+
+        The payload may be passed already UTF-8 encoded, which saves re-encoding
+        when the same payload is checked against several keys.
+
+        Raises SignatureVerificationError if the public key curve doesn't match the
+        signature algorithm or if verification cannot be performed.
+        """
+        if not self.public_key.matches_signature_algorithm(signature_method):
+            msg = (
+                f"Public key curve mismatch: signature algorithm specifies "
+                f"'{signature_method}' but public key uses '{self.public_key.curve}'"
+            )
+            raise SignatureVerificationError(msg)
+
+        signature_bytes = decode_signature_data(signature_data, signature_encoding)
+        algorithm = _ECDSA_ALGORITHMS[get_hash_algorithm(signature_method)]
+        payload_bytes = (
+            payload_json if isinstance(payload_json, bytes) else payload_json.encode("utf-8")
+        )
+
+        try:
+            self._crypto_public_key.verify(signature_bytes, payload_bytes, algorithm)
+        except InvalidSignature:
+            return False
+        except (TypeError, ValueError) as e:
+            msg = f"Signature verification failed: {e}"
+            raise SignatureVerificationError(msg, reason="invalid_signature_format") from e
+        else:
+            return True
+
+
+def build_verifier(public_key_hex: str) -> Verifier:
+    """Parse a public key once into a Verifier for repeated signature checks.
+
+    Requires the 'cryptography' package (install with: pip install pyocmf[crypto]).
+
+    Raises SignatureVerificationError if the public key cannot be parsed.
+    """
+    check_cryptography_available()
+
+    from pyocmf.models.public_key import PublicKey
+
+    try:
+        public_key_info, crypto_public_key = PublicKey._load(public_key_hex)
+    except (PublicKeyError, EncodingError, ImportError) as e:
+        msg = f"Failed to parse public key: {e}"
+        raise SignatureVerificationError(msg) from e
+
+    return Verifier(public_key_info, crypto_public_key)
+
+
+@functools.lru_cache(maxsize=128)
+def _cached_verifier(public_key_hex: str) -> Verifier:
+    # A few keys usually sign many records, so each key's DER is parsed only once.
+    # Kept private so callers never share a cached Verifier instance.
+    return build_verifier(public_key_hex)
+
 
 def verify_signature(
-    payload_json: str,
+    payload_json: str | bytes,
     signature_data: str,
     signature_method: SignatureMethod | None,
     signature_encoding: SignatureEncodingType | None,
@@ -63,42 +161,29 @@ def verify_signature(
     Requires the 'cryptography' package (install with: pip install pyocmf[crypto]).
 
     Raises SignatureVerificationError if the public key curve doesn't match the
-    signature algorithm or if verification cannot be performed.
+    signature algorithm or if verification cannot be performed. Parsed keys are
+    cached, so repeated checks with the same key do not parse it again.
     """
-    check_cryptography_available()
+    return _cached_verifier(public_key_hex).verify(
+        payload_json, signature_data, signature_method, signature_encoding
+    )
 
-    from pyocmf.models.public_key import PublicKey
-
-    try:
-        public_key_info = PublicKey.from_string(public_key_hex)
-    except (PublicKeyError, EncodingError, ImportError) as e:
-        msg = f"Failed to parse public key: {e}"
-        raise SignatureVerificationError(msg) from e
 
-    if not public_key_info.matches_signature_algorithm(signature_method):
-        msg = (
-            f"Public key curve mismatch: signature algorithm specifies "
-            f"'{signature_method}' but public key uses '{public_key_info.curve}'"
-        )
-        raise SignatureVerificationError(msg)
+def verify_batch(
+    ocmfs: Sequence[OCMF], public_key: PublicKey | str, *, max_workers: int | None = None
+) -> list[bool]:
+    """Verify the signatures of many OCMF records made with the same public key.
 
-    signature_bytes = decode_signature_data(signature_data, signature_encoding)
-    hash_algorithm = get_hash_algorithm(signature_method)
-    payload_bytes = payload_json.encode("utf-8")
+    The key is parsed once and the checks run on a thread pool. cryptography
+    releases the GIL while OpenSSL verifies, so the threads run in parallel.
+    Results are returned in input order.
 
-    key_bytes = bytes.fromhex(public_key_hex)
-    crypto_public_key = serialization.load_der_public_key(key_bytes)
+    Raises SignatureVerificationError like OCMF.verify_signature for the first
+    record that cannot be verified.
+    """
+    from pyocmf.models.public_key import PublicKey
 
-    try:
-        crypto_public_key.verify(
-            signature_bytes,
-            payload_bytes,
-            ec.ECDSA(hash_algorithm()),
-        )
-    except InvalidSignature:
-        return False
-    except (TypeError, ValueError) as e:
-        msg = f"Signature verification failed: {e}"
-        raise SignatureVerificationError(msg, reason="invalid_signature_format") from e
-    else:
-        return True
+    key = public_key.key if isinstance(public_key, PublicKey) else public_key
+    verifier = _cached_verifier(key)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(lambda ocmf: ocmf.verify_signature_with(verifier), ocmfs))
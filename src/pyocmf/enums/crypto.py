@@ -65,11 +65,18 @@ class SignatureMethod(enum.StrEnum):
 
     @property
     def curve(self) -> CurveType:
-        return CurveType(self.value.split("-")[1])
+        return _METHOD_PARTS[self][0]
 
     @property
     def hash_algorithm(self) -> HashAlgorithm:
-        return HashAlgorithm(self.value.split("-")[2])
+        return _METHOD_PARTS[self][1]
+
+
+# Split once at import; curve and hash_algorithm are looked up on every verification
+_METHOD_PARTS = {
+    method: (CurveType(method.value.split("-")[1]), HashAlgorithm(method.value.split("-")[2]))
+    for method in SignatureMethod
+}
 
 
 class SignatureEncodingType(enum.StrEnum):
@@ -24,13 +24,16 @@ class MeterReadingReason(enum.StrEnum):
     TARIFF_CHANGE = "T"
 
     def is_end_reading(self) -> bool:
-        return self in {
-            MeterReadingReason.END,
-            MeterReadingReason.TERMINATION_LOCAL,
-            MeterReadingReason.TERMINATION_REMOTE,
-            MeterReadingReason.TERMINATION_ABORT,
-            MeterReadingReason.TERMINATION_POWER_FAILURE,
-        }
+        return self in _END_READING_REASONS
+
+
+_END_READING_REASONS = frozenset({
+    MeterReadingReason.END,
+    MeterReadingReason.TERMINATION_LOCAL,
+    MeterReadingReason.TERMINATION_REMOTE,
+    MeterReadingReason.TERMINATION_ABORT,
+    MeterReadingReason.TERMINATION_POWER_FAILURE,
+})
 
 
 class MeterStatus(enum.StrEnum):
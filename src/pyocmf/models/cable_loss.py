@@ -5,6 +5,8 @@ from pyocmf.types.numbers import OCMFNumber
 
 
 class CableLossCompensation(pydantic.BaseModel):
+    model_config = pydantic.ConfigDict(frozen=True)
+
     LN: str | None = pydantic.Field(
         default=None, max_length=20, description="Loss Compensation Naming"
     )
@@ -31,6 +31,11 @@ class PublicKey(pydantic.BaseModel):
     @classmethod
     def from_string(cls, key_string: str) -> Self:
         """Parse DER public key string (hex or base64) and extract metadata."""
+        return cls._load(key_string)[0]
+
+    @classmethod
+    def _load(cls, key_string: str) -> tuple[Self, ec.EllipticCurvePublicKey]:
+        # Also hands back the loaded key so verifiers don't parse the DER again
         check_cryptography_available()
 
         key_string = key_string.strip()
@@ -62,7 +67,7 @@ class PublicKey(pydantic.BaseModel):
             key_size = public_key.curve.key_size
             block_length = key_size // 8
 
-            return cls(
+            public_key_info = cls(
                 key=key_hex,
                 curve=curve_name,
                 size=key_size,
@@ -74,6 +79,8 @@ class PublicKey(pydantic.BaseModel):
         except (ValueError, TypeError) as e:
             msg = f"Failed to parse public key: {e}"
             raise PublicKeyError(msg) from e
+        else:
+            return public_key_info, public_key
 
     @property
     def key_type_identifier(self) -> KeyType:
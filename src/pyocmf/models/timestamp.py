@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+import functools
 import re
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Annotated
 
@@ -9,29 +10,63 @@ from pydantic.types import StringConstraints
 
 from pyocmf.enums.reading import TimeStatus
 
-OCMFTimeFormat = Annotated[
-    str,
-    StringConstraints(pattern=r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2},\d{3}[+-]\d{4} [UISR]$"),
-]
+_OCMF_TIMESTAMP_REGEX = r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2},\d{3}[+-]\d{4} [UISR]$"
 
+OCMFTimeFormat = Annotated[str, StringConstraints(pattern=_OCMF_TIMESTAMP_REGEX)]
 
-@dataclass(frozen=True)
+# ASCII: the spec only allows ASCII digits, and the narrower \d matches faster
+_OCMF_TIMESTAMP_PATTERN = re.compile(_OCMF_TIMESTAMP_REGEX, re.ASCII)
+
+_ISO_TIMESTAMP_LENGTH = len("2023-06-15T14:30:45.123+02:00")
+
+_ISO_OFFSET_COLON_PATTERN = re.compile(r"([+-]\d{2}):(\d{2})$")
+
+_TIME_STATUS_BY_VALUE = {status.value: status for status in TimeStatus}
+
+
+def _parse_time_status(value: str) -> TimeStatus:
+    # A plain dict hit is much cheaper than calling the enum class; unknown values
+    # still go through TimeStatus to raise its usual ValueError
+    return _TIME_STATUS_BY_VALUE.get(value) or TimeStatus(value)
+
+
+@dataclass(frozen=True, slots=True)
 class OCMFTimestamp:
     timestamp: datetime
     status: TimeStatus
+    # Spec-conformant input string, reused by serialize() instead of re-formatting.
+    # Not an init field, so dataclasses.replace() never carries a stale one over.
+    _source: str | None = field(default=None, init=False, compare=False, repr=False)
 
     def __str__(self) -> str:
         return self.serialize()
 
     @classmethod
+    @functools.lru_cache(maxsize=4096)
     def from_string(cls, timestamp_str: str) -> OCMFTimestamp:
         """Parse OCMF timestamp string to OCMFTimestamp.
 
         OCMF format: "2023-06-15T14:30:45,123+0200 S" (note: comma for milliseconds).
+        Results are cached per string, which is safe because timestamps are immutable
+        and pays off when the same records are parsed again, e.g. for verification.
         """
+        # Fast path for the exact spec format: the comma and the status separator
+        # sit at known offsets, so the string is sliced instead of scanned, and it
+        # is kept as the serialized form since formatting would reproduce it.
+        # The fields are set directly because the generated frozen __init__ costs
+        # about as much as the parse itself.
+        if _OCMF_TIMESTAMP_PATTERN.fullmatch(timestamp_str):
+            dt = datetime.fromisoformat(f"{timestamp_str[:19]}.{timestamp_str[20:-2]}")
+            parsed = object.__new__(cls)
+            set_field = object.__setattr__
+            set_field(parsed, "timestamp", dt)
+            set_field(parsed, "status", _parse_time_status(timestamp_str[-1]))
+            set_field(parsed, "_source", timestamp_str)
+            return parsed
+
         if " " in timestamp_str:
             ts_part, status_part = timestamp_str.rsplit(" ", 1)
-            status = TimeStatus(status_part)
+            status = _parse_time_status(status_part)
         else:
             ts_part = timestamp_str
             status = TimeStatus.UNKNOWN_OR_UNSYNCHRONIZED
@@ -47,11 +82,19 @@ class OCMFTimestamp:
         Uses comma for milliseconds and a colon-free timezone offset (e.g. +0200)
         as required by the OCMF spec.
         """
+        if self._source is not None:
+            return self._source
+
         if self.timestamp.tzinfo is None:
             error_message = "Datetime must be timezone-aware for OCMF format"
             raise ValueError(error_message)
 
         iso_str = self.timestamp.isoformat(timespec="milliseconds")
-        ocmf_str = re.sub(r"([+-]\d{2}):(\d{2})$", r"\1\2", iso_str.replace(".", ","))
+        # Usual shape "YYYY-MM-DDTHH:MM:SS.mmm+HH:MM": swap the separators by slicing
+        if len(iso_str) == _ISO_TIMESTAMP_LENGTH:
+            return f"{iso_str[:19]},{iso_str[20:26]}{iso_str[27:]} {self.status.value}"
+
+        # Anything else, e.g. offsets with seconds, goes through the general rewrite
+        ocmf_str = _ISO_OFFSET_COLON_PATTERN.sub(r"\1\2", iso_str.replace(".", ","))
 
         return f"{ocmf_str} {self.status.value}"
@@ -17,6 +17,11 @@ _ACCUMULATION_REGISTER_PATTERN = re.compile(r"01-00:[BC][0-3]\.08\.00$")
 _TRANSACTION_REGISTER_PATTERN = re.compile(r"01-00:[BC][23]\.08\.00$")
 _ACTIVE_ENERGY_PATTERN = re.compile(r"01-00:0[12]\.08\.00$")
 
+# Same registers, matched on the raw code with an optional "*suffix", so the
+# per-reading checks need no _normalize split
+_ACCUMULATION_REGISTER_CODE_PATTERN = re.compile(r"01-00:[BC][0-3]\.08\.00(?:\*|$)")
+_TRANSACTION_REGISTER_CODE_PATTERN = re.compile(r"01-00:[BC][23]\.08\.00(?:\*|$)")
+
 
 def _normalize(obis_code: str) -> str:
     return obis_code.split("*")[0]
@@ -162,13 +167,11 @@ def is_billing_relevant(obis_code: str) -> bool:
 
 
 def is_accumulation_register(obis_code: str) -> bool:
-    normalized = _normalize(obis_code)
-    return bool(_ACCUMULATION_REGISTER_PATTERN.match(normalized))
+    return _ACCUMULATION_REGISTER_CODE_PATTERN.match(obis_code) is not None
 
 
 def is_transaction_register(obis_code: str) -> bool:
-    normalized = _normalize(obis_code)
-    return bool(_TRANSACTION_REGISTER_PATTERN.match(normalized))
+    return _TRANSACTION_REGISTER_CODE_PATTERN.match(obis_code) is not None
 
 
 def validate_obis_for_billing(obis_code: str | None) -> tuple[bool, str | None]:
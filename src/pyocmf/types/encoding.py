@@ -6,12 +6,14 @@ from pydantic import AfterValidator, WithJsonSchema
 
 from pyocmf.exceptions import Base64DecodingError, EncodingTypeError, HexDecodingError
 
+_HEX_PATTERN = re.compile(r"[0-9a-fA-F]+")
+
 
 def validate_hex_string(value: str) -> str:
     if not isinstance(value, str):
         msg = "string required"
         raise EncodingTypeError(msg, value=value, expected_type="str")
-    if not re.fullmatch(r"^[0-9a-fA-F]+$", value):
+    if not _HEX_PATTERN.fullmatch(value):
         msg = "invalid hexadecimal string"
         raise HexDecodingError(msg, value=value)
     return value
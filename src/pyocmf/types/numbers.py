@@ -6,11 +6,34 @@ import pydantic
 # OCMF spec requires numeric fields (RV, CL, LR) to be JSON Numbers. Pydantic
 # serializes Decimal as a JSON string by default, which would violate the spec,
 # so model_dump_json serializes through float. OCMF.to_string instead uses
-# utils.serialization.model_to_ocmf_json, which emits the Decimal exactly,
+# the utils.serialization encoder, which emits the Decimal exactly,
 # preserving the decimal places of parsed input (e.g. 2935.600).
 OCMFNumber = Annotated[
     decimal.Decimal,
     pydantic.PlainSerializer(float, return_type=float, when_used="json"),
 ]
 
-__all__ = ["OCMFNumber"]
+
+def to_ocmf_number(value: object) -> decimal.Decimal:
+    """Convert a decoded JSON value to Decimal without running pydantic validation.
+
+    Accepts what OCMFNumber validation accepts (finite numbers and numeric strings)
+    and raises TypeError or ValueError for anything else, including NaN and infinity.
+    """
+    if isinstance(value, decimal.Decimal):
+        return value
+    if isinstance(value, bool) or not isinstance(value, (int, float, str)):
+        msg = f"expected a number, got {type(value).__name__}"
+        raise TypeError(msg)
+    try:
+        result = decimal.Decimal(str(value))
+    except decimal.InvalidOperation as e:
+        msg = f"expected a number, got {value!r}"
+        raise ValueError(msg) from e
+    if not result.is_finite():
+        msg = f"expected a finite number, got {value!r}"
+        raise ValueError(msg)
+    return result
+
+
+__all__ = ["OCMFNumber", "to_ocmf_number"]
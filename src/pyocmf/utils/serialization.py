@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import decimal
 import json
+from collections.abc import Callable
+from json.encoder import encode_basestring_ascii
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
@@ -17,17 +19,66 @@ def model_to_ocmf_json(model: pydantic.BaseModel) -> str:
     number token, so this assembles the JSON string directly from the dumped
     model.
     """
-    return _encode(model.model_dump(mode="python", exclude_none=True))
+    return flat_dict_to_ocmf_json(model.model_dump(mode="python", exclude_none=True))
+
+
+def flat_dict_to_ocmf_json(data: dict) -> str:
+    """Serialize an already dumped model dict to compact OCMF JSON.
+
+    Used with Payload.to_flat_dict, which builds the dict without going
+    through the pydantic serializer.
+    """
+    return _encode(data)
 
 
 def _encode(value: Any) -> str:
+    encoder = _ENCODERS.get(type(value))
+    if encoder is None:
+        encoder = _ENCODERS[type(value)] = _find_encoder(value)
+    return encoder(value)
+
+
+def _find_encoder(value: Any) -> Callable[[Any], str]:
+    # Resolves subclasses such as StrEnum members; the result is cached per type
+    if isinstance(value, str):
+        return encode_basestring_ascii
     if isinstance(value, decimal.Decimal):
-        if not value.is_finite():
-            msg = f"Cannot represent non-finite Decimal '{value}' as a JSON number"
-            raise ValueError(msg)
-        return str(value)
+        return _encode_decimal
     if isinstance(value, dict):
-        return "{" + ",".join(f"{json.dumps(str(k))}:{_encode(v)}" for k, v in value.items()) + "}"
+        return _encode_dict
     if isinstance(value, (list, tuple)):
-        return "[" + ",".join(_encode(v) for v in value) + "]"
-    return json.dumps(value)
+        return _encode_list
+    return json.dumps
+
+
+def _encode_decimal(value: decimal.Decimal) -> str:
+    if not value.is_finite():
+        msg = f"Cannot represent non-finite Decimal '{value}' as a JSON number"
+        raise ValueError(msg)
+    return str(value)
+
+
+def _encode_dict(value: dict) -> str:
+    return (
+        "{"
+        + ",".join(f"{encode_basestring_ascii(str(k))}:{_encode(v)}" for k, v in value.items())
+        + "}"
+    )
+
+
+def _encode_list(value: list | tuple) -> str:
+    return "[" + ",".join(_encode(v) for v in value) + "]"
+
+
+# Exact-type dispatch for the JSON encoder. encode_basestring_ascii is the C
+# routine json.dumps uses for strings; calling it directly skips building a
+# JSONEncoder for every string in the payload.
+_ENCODERS: dict[type, Callable[[Any], str]] = {
+    str: encode_basestring_ascii,
+    decimal.Decimal: _encode_decimal,
+    dict: _encode_dict,
+    list: _encode_list,
+    bool: json.dumps,
+    int: json.dumps,
+    type(None): json.dumps,
+}
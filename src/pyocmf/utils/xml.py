@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import pathlib
 from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from xml.etree.ElementTree import Element  # noqa: S405
 
@@ -36,40 +37,44 @@ class OcmfContainer:
         self._entries = entries
 
     @classmethod
-    def from_xml(cls, xml_path: pathlib.Path | str) -> OcmfContainer:
+    def from_xml(cls, xml_path: pathlib.Path | str, *, validate: bool = True) -> OcmfContainer:
         """Parse OCMF data from an XML file.
 
         Args:
             xml_path: Path to the XML file
+            validate: Whether to validate the OCMF payloads, see OCMF.from_string.
+                Only pass False for files from a trusted source; malformed records
+                still raise OcmfPayloadError, but payload rules are not checked.
 
         Returns:
             OcmfContainer with parsed OCMF entries
 
         Raises:
             XmlParsingError: If the XML file cannot be parsed
+            OcmfPayloadError: If an OCMF payload is malformed
             DataNotFoundError: If no OCMF data is found
 
         """
         path = pathlib.Path(xml_path)
 
-        try:
-            tree = ET.parse(path)
-            root = tree.getroot()
-        except ET.ParseError as e:
-            msg = f"Failed to parse XML file: {e}"
-            raise XmlParsingError(msg) from e
-
         entries = []
         seen_strings: set[str] = set()
 
-        for value_elem in root.findall("value"):
-            ocmf_str = _extract_ocmf_string(value_elem)
+        try:
+            for value_elem in _iter_value_elements(path):
+                children = _children_by_tag(value_elem)
+                ocmf_str = _extract_ocmf_string(children)
 
-            if ocmf_str and ocmf_str not in seen_strings:
-                ocmf = OCMF.from_string(ocmf_str)
-                public_key = _extract_public_key(value_elem)
-                entries.append(OcmfRecord(ocmf=ocmf, public_key=public_key))
-                seen_strings.add(ocmf_str)
+                if ocmf_str and ocmf_str not in seen_strings:
+                    ocmf = OCMF.from_string(ocmf_str, validate=validate)
+                    public_key = _extract_public_key(children)
+                    entries.append(OcmfRecord(ocmf=ocmf, public_key=public_key))
+                    seen_strings.add(ocmf_str)
+
+                value_elem.clear()
+        except ET.ParseError as e:
+            msg = f"Failed to parse XML file: {e}"
+            raise XmlParsingError(msg) from e
 
         if not entries:
             msg = "No OCMF data found in XML file"
@@ -77,6 +82,20 @@ class OcmfContainer:
 
         return cls(entries)
 
+    def verify_signatures(self, *, max_workers: int | None = None) -> list[bool]:
+        """Verify the signature of every entry with its own public key.
+
+        The checks run on a thread pool, since cryptography releases the GIL while
+        verifying; parsed public keys are shared through the verifier cache.
+        Results are in entry order.
+
+        Raises:
+            SignatureVerificationError: If an entry has no public key or cannot be verified
+
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(OcmfRecord.verify_signature, self._entries))
+
     @property
     def entries(self) -> list[OcmfRecord]:
         return self._entries
@@ -91,22 +110,46 @@ class OcmfContainer:
         return self._entries[index]
 
 
-def _extract_ocmf_string(element: Element) -> str | None:
-    sd = element.find("signedData")
+def _iter_value_elements(path: pathlib.Path) -> Iterator[Element]:
+    """Stream the ``value`` children of the document root.
+
+    Each element is yielded once it is fully parsed, so callers can clear it
+    afterwards instead of keeping the whole tree in memory.
+    """
+    depth = 0
+    for event, elem in ET.iterparse(path, events=("start", "end")):
+        if event == "start":
+            depth += 1
+            continue
+        depth -= 1
+        if depth == 1 and elem.tag == "value":
+            yield elem
+
+
+def _children_by_tag(element: Element) -> dict[str, Element]:
+    """Map each child tag to its first occurrence, scanning the children once."""
+    children: dict[str, Element] = {}
+    for child in element:
+        children.setdefault(child.tag, child)
+    return children
+
+
+def _extract_ocmf_string(children: dict[str, Element]) -> str | None:
+    sd = children.get("signedData")
     if sd is not None and sd.text:
         text = sd.text.strip()
         if sd.get("format") == OCMF_HEADER or text.startswith(OCMF_PREFIX):
             return text
 
-    ed = element.find("encodedData")
+    ed = children.get("encodedData")
     if ed is not None and ed.get("format") == OCMF_HEADER and ed.text:
         return ed.text.strip()
 
     return None
 
 
-def _extract_public_key(element: Element) -> PublicKey | None:
-    pk = element.find("publicKey")
+def _extract_public_key(children: dict[str, Element]) -> PublicKey | None:
+    pk = children.get("publicKey")
     if pk is not None and pk.text:
         try:
             key_str = "".join(pk.text.split())
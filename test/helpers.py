@@ -17,6 +17,16 @@ if TYPE_CHECKING:
     from pyocmf.compliance.models import EichrechtIssue
     from pyocmf.utils.xml import OcmfRecord
 
+VALID_OCMF_STRING = (
+    'OCMF|{"FV":"1.0","GI":"ABL SBC-301","GS":"808829900001","PG":"T12345",'
+    '"MS":"BQ27400330016","IS":true,"IL":"VERIFIED","IF":["RFID_PLAIN","OCPP_RS_TLS"],'
+    '"IT":"ISO14443","ID":"1F2D3A4F","RD":['
+    '{"TM":"2018-07-24T13:22:04,000+0200 S","TX":"B","RV":2935.600,'
+    '"RI":"01-00:B2.08.00*FF","RU":"kWh","RT":"DC","EF":"","ST":"G"},'
+    '{"TM":"2018-07-24T13:26:04,000+0200 S","TX":"E","RV":2965.1}'
+    ']}|{"SD":"1234567890ABCDEF"}'
+)
+
 
 def should_skip_xml_file(xml_file: pathlib.Path) -> tuple[bool, str | None]:
     file_name_lower = xml_file.name.lower()
@@ -164,6 +174,7 @@ def create_transaction_pair(
     unit: EnergyUnit = EnergyUnit.KWH,
     identification_type: IdentificationType = IdentificationType.ISO14443,
     identification_data: str = "12345678",
+    end_tx: MeterReadingReason = MeterReadingReason.END,
 ) -> tuple[OCMF, OCMF]:
     """Create a pair of begin/end OCMF objects for transaction testing."""
     if end_serial is None:
@@ -184,7 +195,7 @@ def create_transaction_pair(
 
     end_reading = create_test_reading(
         timestamp=end_timestamp,
-        tx=MeterReadingReason.END,
+        tx=end_tx,
         rv=end_value,
         ri=obis_code,
         ru=unit,
@@ -4,8 +4,10 @@ import decimal
 
 from pyocmf.compliance import (
     IssueCode,
+    check_eichrecht_payload,
     check_eichrecht_reading,
     check_eichrecht_transaction,
+    has_eichrecht_error,
     validate_transaction_pair,
 )
 from pyocmf.core.reading import MeterReadingReason, MeterStatus
@@ -244,6 +246,46 @@ class TestValidateTransactionPair:
             MeterReadingReason.TERMINATION_ABORT,
             MeterReadingReason.TERMINATION_POWER_FAILURE,
         ]:
-            begin, end = create_transaction_pair()
-            end.payload.RD[0].TX = tx_type
+            begin, end = create_transaction_pair(end_tx=tx_type)
             assert validate_transaction_pair(begin, end) is True
+
+
+class TestHasEichrechtError:
+    def test_valid_payload_has_no_error(self) -> None:
+        payload = create_test_payload(readings=[create_test_reading(tx=MeterReadingReason.END)])
+        assert has_eichrecht_error(payload) is False
+
+    def test_warning_only_is_not_an_error(self) -> None:
+        reading = create_test_reading(
+            timestamp="2023-01-01T12:00:00,000+0000 U", tx=MeterReadingReason.END
+        )
+        assert has_eichrecht_error(create_test_payload(readings=[reading])) is False
+
+    def test_error_in_later_reading_detected(self) -> None:
+        readings = [
+            create_test_reading(tx=MeterReadingReason.BEGIN),
+            create_test_reading(tx=MeterReadingReason.END, st=MeterStatus.TIMEOUT),
+        ]
+        assert has_eichrecht_error(create_test_payload(readings=readings)) is True
+
+    def test_error_flags_detected(self) -> None:
+        reading = create_test_reading(tx=MeterReadingReason.END, ef="E")
+        assert has_eichrecht_error(create_test_payload(readings=[reading])) is True
+
+    def test_no_readings_is_an_error(self) -> None:
+        assert has_eichrecht_error(create_test_payload(readings=[])) is True
+
+
+class TestCheckEichrechtPayload:
+    def test_no_readings_reported(self) -> None:
+        issues = check_eichrecht_payload(create_test_payload(readings=[]))
+        assert [issue.code for issue in issues] == [IssueCode.NO_READINGS]
+
+    def test_issues_of_every_reading_reported(self) -> None:
+        readings = [
+            create_test_reading(tx=MeterReadingReason.BEGIN, ef="E"),
+            create_test_reading(tx=MeterReadingReason.END, st=MeterStatus.TIMEOUT),
+        ]
+        issues = check_eichrecht_payload(create_test_payload(readings=readings))
+        assert_has_issue(issues, IssueCode.ERROR_FLAGS)
+        assert_has_issue(issues, IssueCode.METER_STATUS)
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import json
 
+import pydantic
 import pytest
 
 from pyocmf.core import OCMF
@@ -14,17 +15,7 @@ from pyocmf.exceptions import (
     SignatureVerificationError,
 )
 
-from ..helpers import create_test_ocmf
-
-VALID_OCMF_STRING = (
-    'OCMF|{"FV":"1.0","GI":"ABL SBC-301","GS":"808829900001","PG":"T12345",'
-    '"MS":"BQ27400330016","IS":true,"IL":"VERIFIED","IF":["RFID_PLAIN","OCPP_RS_TLS"],'
-    '"IT":"ISO14443","ID":"1F2D3A4F","RD":['
-    '{"TM":"2018-07-24T13:22:04,000+0200 S","TX":"B","RV":2935.600,'
-    '"RI":"01-00:B2.08.00*FF","RU":"kWh","RT":"DC","EF":"","ST":"G"},'
-    '{"TM":"2018-07-24T13:26:04,000+0200 S","TX":"E","RV":2965.1}'
-    ']}|{"SD":"1234567890ABCDEF"}'
-)
+from ..helpers import VALID_OCMF_STRING, create_test_ocmf
 
 
 class TestFromString:
@@ -39,10 +30,31 @@ class TestFromString:
         ocmf = OCMF.from_string(hex_string)
         assert ocmf.payload.GS == "808829900001"
 
+    def test_parses_hex_with_surrounding_whitespace(self) -> None:
+        hex_string = VALID_OCMF_STRING.encode("utf-8").hex()
+        ocmf = OCMF.from_string(f"  {hex_string}\n")
+        assert ocmf.payload.GS == "808829900001"
+
     def test_invalid_prefix_and_not_hex_raises(self) -> None:
         with pytest.raises(HexDecodingError):
             OCMF.from_string("NOT-OCMF-AND-NOT-HEX")
 
+    def test_too_short_hex_raises(self) -> None:
+        with pytest.raises(OcmfFormatError):
+            OCMF.from_string("4f434d46")
+
+    def test_odd_length_hex_raises(self) -> None:
+        with pytest.raises(HexDecodingError):
+            OCMF.from_string(VALID_OCMF_STRING.encode("utf-8").hex()[:-1])
+
+    def test_hex_without_ocmf_prefix_raises(self) -> None:
+        with pytest.raises(OcmfFormatError):
+            OCMF.from_string(b"\xffNOT-OCMF|{}|{}".hex())
+
+    def test_oversized_input_raises(self) -> None:
+        with pytest.raises(OcmfFormatError, match="too long"):
+            OCMF.from_string("OCMF|" + " " * OCMF.MAX_OCMF_LEN)
+
     def test_missing_signature_section_raises(self) -> None:
         with pytest.raises(OcmfFormatError):
             OCMF.from_string('OCMF|{"PG":"T1"}')
@@ -51,11 +63,80 @@ class TestFromString:
         with pytest.raises(OcmfPayloadError):
             OCMF.from_string('OCMF|{"PG":"T1"}|{"SD":"abcd"}')
 
+    @pytest.mark.parametrize("validate", [True, False])
+    @pytest.mark.parametrize(
+        "payload_json",
+        [
+            '["not", "an", "object"]',
+            '{"PG":"T1","IS":true,"RD":"none"}',
+            '{"PG":"T1","IS":true,"RD":[42]}',
+            '{"PG":"T1","IS":true,"RD":[{"TM":"yesterday","ST":"G"}]}',
+            '{"PG":"T1","IS":true,"RD":[{"TM":"2018-07-24T13:22:04,000+0200 S"}]}',
+            (
+                '{"PG":"T1","IS":true,"RD":[{"TM":"2018-07-24T13:22:04,000+0200 S","ST":"G",'
+                '"RV":"lots","RI":"01-00:B2.08.00","RU":"kWh"}]}'
+            ),
+            (
+                '{"PG":"T1","IS":true,"RD":[{"TM":"2018-07-24T13:22:04,000+0200 S","ST":"G",'
+                '"RV":"NaN","RI":"01-00:B2.08.00","RU":"kWh"}]}'
+            ),
+            '{"PG":"T1","IS":true,"IF":["NO_SUCH_FLAG"],"RD":[]}',
+            '{"PG":"T1","IS":true,"LC":{"LN":"cable","LI":1,"LU":"mOhm"},"RD":[]}',
+        ],
+        ids=[
+            "not-an-object",
+            "readings-not-a-list",
+            "reading-not-an-object",
+            "bad-timestamp",
+            "missing-status",
+            "non-numeric-reading-value",
+            "non-finite-reading-value",
+            "unknown-identification-flag",
+            "cable-loss-without-resistance",
+        ],
+    )
+    def test_malformed_payload_raises_payload_error(
+        self, payload_json: str, validate: bool
+    ) -> None:
+        with pytest.raises(OcmfPayloadError):
+            OCMF.from_string(f'OCMF|{payload_json}|{{"SD":"abcd"}}', validate=validate)
+
     def test_invalid_signature_json_raises(self) -> None:
         valid_payload = VALID_OCMF_STRING.split("|")[1]
         with pytest.raises(OcmfSignatureError):
             OCMF.from_string(f"OCMF|{valid_payload}|not-json")
 
+    def test_unvalidated_parse_matches_validated(self) -> None:
+        validated = OCMF.from_string(VALID_OCMF_STRING)
+        trusted = OCMF.from_string(VALID_OCMF_STRING, validate=False)
+        assert trusted == validated
+        assert trusted.to_string() == validated.to_string()
+
+
+class TestImmutability:
+    def test_sections_cannot_be_reassigned(self) -> None:
+        ocmf = OCMF.from_string(VALID_OCMF_STRING)
+        other = create_test_ocmf()
+        with pytest.raises(pydantic.ValidationError):
+            ocmf.payload = other.payload  # ty: ignore[invalid-assignment]
+
+    def test_payload_and_readings_cannot_be_modified(self) -> None:
+        ocmf = OCMF.from_string(VALID_OCMF_STRING)
+        with pytest.raises(pydantic.ValidationError):
+            ocmf.payload.GS = "other"  # ty: ignore[invalid-assignment]
+        with pytest.raises(pydantic.ValidationError):
+            ocmf.payload.RD[0].TX = ocmf.payload.RD[1].TX  # ty: ignore[invalid-assignment]
+
+    def test_unknown_fields_rejected(self) -> None:
+        ocmf = create_test_ocmf()
+        with pytest.raises(pydantic.ValidationError):
+            OCMF.model_validate({
+                "header": "OCMF",
+                "payload": ocmf.payload,
+                "signature": ocmf.signature,
+                "extra": "x",
+            })
+
 
 class TestReadingFields:
     def test_rt_is_parsed(self) -> None:
@@ -89,6 +170,11 @@ class TestToString:
         reparsed = OCMF.from_string(ocmf.to_string(hex=True))
         assert reparsed.payload == ocmf.payload
 
+    def test_hex_roundtrip_with_non_ascii_text(self) -> None:
+        ocmf = OCMF.from_string(VALID_OCMF_STRING.replace('"GI":"ABL SBC-301"', '"GI":"Zähler"'))
+        reparsed = OCMF.from_string(ocmf.to_string(hex=True))
+        assert reparsed.payload.GI == "Zähler"
+
     def test_rv_serialized_as_json_number(self) -> None:
         # OCMF spec Table 7: RV is of JSON type Number, not String
         ocmf = OCMF.from_string(VALID_OCMF_STRING)
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import decimal
 import warnings
+from typing import Any
 
 import pydantic
 import pytest
@@ -13,6 +15,7 @@ from pyocmf.enums.identifiers import (
     IdentificationFlagRFID,
     IdentificationType,
 )
+from pyocmf.enums.reading import MeterReadingReason
 
 
 class TestIdValidationByType:
@@ -118,6 +121,16 @@ class TestIdValidationByType:
         )
         assert payload.ID == "DETNME12345678"
 
+    def test_repeated_ids_are_checked_per_type(self) -> None:
+        # A previously accepted ID must not pass for a type with a different format
+        emaid = "DETNME12345678"
+        Payload(PG="T1", GS="000001", IS=True, IT=IdentificationType.EMAID, ID=emaid, RD=[])
+        for _ in range(2):
+            with pytest.raises(pydantic.ValidationError, match="does not match expected format"):
+                Payload(
+                    PG="T1", GS="000001", IS=True, IT=IdentificationType.ISO7812, ID=emaid, RD=[]
+                )
+
     def test_iso7812_accepts_digits_only(self) -> None:
         payload = Payload(
             PG="T1",
@@ -387,3 +400,116 @@ class TestTTMaxLength:
             RD=[],
         )
         assert payload.TT is None
+
+
+FLAT_PAYLOAD: dict[str, Any] = {
+    "FV": "1.0",
+    "GS": "12345",
+    "PG": "T1",
+    "IS": False,
+    "RD": [
+        {
+            "TM": "2023-01-01T12:00:00,000+0000 S",
+            "TX": "B",
+            "RV": decimal.Decimal("0.0"),
+            "RI": "01-00:B2.08.00*FF",
+            "RU": "kWh",
+            "CL": 0,
+            "EF": "",
+            "ST": "G",
+        },
+        {"TM": "2023-01-01T12:10:00,000+0000 S", "TX": "E", "RV": decimal.Decimal("10.5")},
+    ],
+}
+
+
+class TestFromFlatDict:
+    def test_validated_applies_reading_inheritance(self) -> None:
+        payload = Payload.from_flat_dict(FLAT_PAYLOAD)
+        assert str(payload.RD[1].RI) == "01-00:B2.08.00*FF"
+        assert payload.RD[1].ST == "G"
+
+    def test_trusted_matches_validated(self) -> None:
+        validated = Payload.from_flat_dict(FLAT_PAYLOAD)
+        trusted = Payload.from_flat_dict(FLAT_PAYLOAD, validate=False)
+        assert trusted == validated
+
+    def test_trusted_converts_field_types(self) -> None:
+        reading = Payload.from_flat_dict(FLAT_PAYLOAD, validate=False).RD[1]
+        assert reading.TX is MeterReadingReason.END
+        assert reading.TX.is_end_reading()
+        assert reading.RI is not None
+        assert reading.RI.is_accumulation_register
+        assert reading.timestamp.minute == 10
+
+    def test_trusted_skips_reading_validators(self) -> None:
+        # CL on a non-accumulation register would be rejected by validation
+        data = {**FLAT_PAYLOAD, "RD": [{**FLAT_PAYLOAD["RD"][0], "RI": "01-00:01.08.00"}]}
+        with pytest.raises(pydantic.ValidationError):
+            Payload.from_flat_dict(data)
+        assert Payload.from_flat_dict(data, validate=False).RD[0].CL == 0
+
+    def test_trusted_skips_payload_validators(self) -> None:
+        payload = Payload.from_flat_dict({**FLAT_PAYLOAD, "PG": "X1"}, validate=False)
+        assert payload.PG == "X1"
+
+    def test_trusted_converts_payload_field_types(self) -> None:
+        data = {
+            **FLAT_PAYLOAD,
+            "FV": 1.0,
+            "IL": "VERIFIED",
+            "IF": ["RFID_PLAIN", "OCPP_RS"],
+            "IT": "ISO14443",
+            "ID": "1F2E3D4C",
+            "CT": "EVSEID",
+            "CI": "DE*ABC*E123",
+            "LC": {"LN": "cable", "LI": 1, "LR": "0.5", "LU": "mOhm"},
+            "XX": "extra",
+        }
+        trusted = Payload.from_flat_dict(data, validate=False)
+        assert trusted == Payload.from_flat_dict(data)
+        assert trusted.to_flat_dict() == Payload.from_flat_dict(data).to_flat_dict()
+
+
+class TestReadingInheritance:
+    def test_complete_readings_keep_their_own_values(self) -> None:
+        first = {**FLAT_PAYLOAD["RD"][0], "RT": "AC"}
+        second = {**first, "TX": "E", "RV": decimal.Decimal("10.5")}
+        payload = Payload.model_validate({**FLAT_PAYLOAD, "RD": [first, second]})
+        assert [reading.TX for reading in payload.RD] == [
+            MeterReadingReason.BEGIN,
+            MeterReadingReason.END,
+        ]
+        assert decimal.Decimal("10.5") == payload.RD[1].RV
+
+    @pytest.mark.parametrize("validate", [True, False])
+    def test_incomplete_readings_are_filled_in(self, validate: bool) -> None:
+        payload = Payload.from_flat_dict(FLAT_PAYLOAD, validate=validate)
+        second = payload.RD[1]
+        assert str(second.RI) == "01-00:B2.08.00*FF"
+        assert second.RU == "kWh"
+        assert second.ST == "G"
+        assert second.TX == MeterReadingReason.END
+        assert "RI" not in FLAT_PAYLOAD["RD"][1]
+
+
+class TestToFlatDict:
+    def test_matches_model_dump(self) -> None:
+        payload = Payload.from_flat_dict({
+            **FLAT_PAYLOAD,
+            "LC": {"LN": "cable", "LR": decimal.Decimal("1.5"), "LU": "mOhm"},
+            "XX": {"vendor": "data"},
+            "YY": None,
+        })
+        assert payload.to_flat_dict() == payload.model_dump(mode="python", exclude_none=True)
+
+    def test_roundtrips_through_from_flat_dict(self) -> None:
+        payload = Payload.from_flat_dict(FLAT_PAYLOAD)
+        assert Payload.from_flat_dict(payload.to_flat_dict()) == payload
+
+    def test_reading_values_are_json_ready(self) -> None:
+        reading = Payload.from_flat_dict(FLAT_PAYLOAD).to_flat_dict()["RD"][1]
+        assert reading["TM"] == "2023-01-01T12:10:00,000+0000 S"
+        assert reading["RI"] == "01-00:B2.08.00*FF"
+        assert reading["RV"] == decimal.Decimal("10.5")
+        assert "EF" not in reading
@@ -83,6 +83,19 @@ class TestCLValidators:
                 CL=decimal.Decimal("-0.5"),  # Should fail
             )
 
+    def test_cl_error_is_reported_on_cl_field(self) -> None:
+        with pytest.raises(pydantic.ValidationError) as exc_info:
+            Reading(
+                TM=tm("2023-01-01T12:00:00,000+0000 S"),
+                TX=MeterReadingReason.END,
+                RV=decimal.Decimal("100.0"),
+                RI=obis("01-00:B0.08.00*FF"),
+                RU=EnergyUnit.KWH,
+                ST=MeterStatus.OK,
+                CL=decimal.Decimal("-0.5"),
+            )
+        assert exc_info.value.errors()[0]["loc"] == ("CL",)
+
     def test_cl_none_is_allowed(self) -> None:
         reading = Reading(
             TM=tm("2023-01-01T12:00:00,000+0000 S"),
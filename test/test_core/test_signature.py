@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import pydantic
+import pytest
+
+from pyocmf.core.signature import Signature
+from pyocmf.enums.crypto import SignatureEncodingType
+
+
+class TestSignatureData:
+    def test_hex_is_default_encoding(self) -> None:
+        assert Signature(SD="3045AB").SD == "3045AB"
+
+    def test_base64_with_base64_encoding(self) -> None:
+        assert Signature(SE=SignatureEncodingType.BASE64, SD="MEUCIQ==").SD == "MEUCIQ=="
+
+    def test_hex_with_omitted_encoding(self) -> None:
+        assert Signature.model_validate({"SD": "3045AB"}).SE == SignatureEncodingType.HEX
+
+    @pytest.mark.parametrize(
+        ("encoding", "data"),
+        [
+            (SignatureEncodingType.HEX, "MEUCIQ=="),
+            (None, "MEUCIQ=="),
+            (SignatureEncodingType.BASE64, "3045AB"),
+        ],
+    )
+    def test_data_in_other_encoding_is_accepted(
+        self, encoding: SignatureEncodingType | None, data: str
+    ) -> None:
+        assert data == Signature(SE=encoding, SD=data).SD
+
+    @pytest.mark.parametrize(
+        ("encoding", "data", "message"),
+        [
+            (SignatureEncodingType.HEX, "not hex!", "invalid hexadecimal string"),
+            (None, "not hex!", "invalid hexadecimal string"),
+            (SignatureEncodingType.BASE64, "not base64!", "invalid base64 string"),
+        ],
+    )
+    def test_data_matching_no_encoding_is_rejected(
+        self, encoding: SignatureEncodingType | None, data: str, message: str
+    ) -> None:
+        with pytest.raises(pydantic.ValidationError, match=message):
+            Signature(SE=encoding, SD=data)
+
+    def test_error_is_reported_on_sd_field(self) -> None:
+        with pytest.raises(pydantic.ValidationError) as exc_info:
+            Signature(SD="not hex!")
+        assert exc_info.value.errors()[0]["loc"] == ("SD",)
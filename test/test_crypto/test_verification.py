@@ -3,7 +3,11 @@ import pathlib
 import pytest
 
 from pyocmf.core import OCMF
+from pyocmf.crypto import verification
+from pyocmf.crypto.verification import build_verifier, decode_signature_data, verify_batch
+from pyocmf.enums.crypto import SignatureEncodingType
 from pyocmf.exceptions import SignatureVerificationError
+from pyocmf.models.public_key import PublicKey
 from pyocmf.utils.xml import OcmfContainer
 
 try:
@@ -97,3 +101,97 @@ class TestSignatureVerification:
             match=r"Public key curve mismatch.*secp256r1.*secp192r1",
         ):
             ocmf.verify_signature(secp192r1_public_key)
+
+
+class TestBuildVerifier:
+    def test_reused_verifier_checks_multiple_records(
+        self,
+        keba_ocmf_string: str,
+        keba_ocmf_string_tampered: str,
+        keba_public_key: str,
+    ) -> None:
+        verifier = build_verifier(keba_public_key)
+
+        assert OCMF.from_string(keba_ocmf_string).verify_signature_with(verifier) is True
+        assert OCMF.from_string(keba_ocmf_string_tampered).verify_signature_with(verifier) is False
+
+    def test_accepts_encoded_payload(self, keba_ocmf_string: str, keba_public_key: str) -> None:
+        ocmf = OCMF.from_string(keba_ocmf_string)
+        payload_json = keba_ocmf_string.split("|")[1]
+
+        assert build_verifier(keba_public_key).verify(
+            payload_json.encode("utf-8"),
+            ocmf.signature.SD,
+            ocmf.signature.SA,
+            ocmf.signature.SE,
+        )
+
+    def test_malformed_public_key_raises(self) -> None:
+        with pytest.raises(SignatureVerificationError, match="Failed to parse public key"):
+            build_verifier("not_a_valid_hex_key")
+
+
+class TestVerifyBatch:
+    def test_results_keep_input_order(
+        self,
+        keba_ocmf_string: str,
+        keba_ocmf_string_tampered: str,
+        keba_public_key: str,
+    ) -> None:
+        valid = OCMF.from_string(keba_ocmf_string)
+        tampered = OCMF.from_string(keba_ocmf_string_tampered)
+
+        results = verify_batch([valid, tampered, valid], keba_public_key, max_workers=2)
+
+        assert results == [True, False, True]
+
+    def test_accepts_public_key_model(self, keba_ocmf_string: str, keba_public_key: str) -> None:
+        ocmf = OCMF.from_string(keba_ocmf_string)
+        assert verify_batch([ocmf], PublicKey.from_string(keba_public_key)) == [True]
+
+    def test_empty_batch(self, keba_public_key: str) -> None:
+        assert verify_batch([], keba_public_key) == []
+
+
+class TestVerifySignatureKeyCache:
+    def test_public_key_is_parsed_once(
+        self, keba_ocmf_string: str, keba_public_key: str, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        verification._cached_verifier.cache_clear()
+        calls = []
+
+        def counting_build_verifier(public_key_hex: str) -> verification.Verifier:
+            calls.append(public_key_hex)
+            return build_verifier(public_key_hex)
+
+        monkeypatch.setattr(verification, "build_verifier", counting_build_verifier)
+        ocmf = OCMF.from_string(keba_ocmf_string)
+
+        assert ocmf.verify_signature(keba_public_key) is True
+        assert ocmf.verify_signature(keba_public_key) is True
+        assert calls == [keba_public_key]
+
+
+class TestDecodeSignatureData:
+    @pytest.mark.parametrize(
+        ("data", "encoding"),
+        [
+            ("414243", SignatureEncodingType.HEX),
+            ("414243", None),
+            ("QUJD", SignatureEncodingType.BASE64),
+        ],
+    )
+    def test_decodes(self, data: str, encoding: SignatureEncodingType | None) -> None:
+        assert decode_signature_data(data, encoding) == b"ABC"
+
+    def test_repeated_decode_is_cached(self) -> None:
+        first = decode_signature_data("414243", SignatureEncodingType.HEX)
+        assert decode_signature_data("414243", SignatureEncodingType.HEX) is first
+
+    @pytest.mark.parametrize(
+        ("data", "encoding"),
+        [("zz", SignatureEncodingType.HEX), ("A", SignatureEncodingType.BASE64)],
+    )
+    def test_invalid_data_raises(self, data: str, encoding: SignatureEncodingType) -> None:
+        with pytest.raises(SignatureVerificationError, match=f"Failed to decode {encoding}"):
+            decode_signature_data(data, encoding)
@@ -0,0 +1,78 @@
+import datetime
+
+import pytest
+
+from pyocmf.enums.reading import TimeStatus
+from pyocmf.models import OCMFTimestamp
+
+
+class TestOCMFTimestampFromString:
+    def test_parses_fixed_width_format(self) -> None:
+        ts = OCMFTimestamp.from_string("2023-06-15T14:30:45,123-0530 S")
+        assert ts.status == TimeStatus.SYNCHRONIZED
+        assert ts.timestamp == datetime.datetime(
+            2023,
+            6,
+            15,
+            14,
+            30,
+            45,
+            123000,
+            tzinfo=datetime.timezone(-datetime.timedelta(hours=5, minutes=30)),
+        )
+
+    @pytest.mark.parametrize(
+        ("value", "status", "microsecond"),
+        [
+            ("2023-06-15T14:30:45,123+0200", TimeStatus.UNKNOWN_OR_UNSYNCHRONIZED, 123000),
+            ("2023-06-15T14:30:45,123456+0200 R", TimeStatus.RELATIVE, 123456),
+            ("2023-06-15T14:30:45.123+02:00 I", TimeStatus.INFORMATIVE, 123000),
+        ],
+    )
+    def test_parses_variable_width_format(
+        self, value: str, status: TimeStatus, microsecond: int
+    ) -> None:
+        ts = OCMFTimestamp.from_string(value)
+        assert ts.status == status
+        assert ts.timestamp.microsecond == microsecond
+
+    def test_invalid_status_raises(self) -> None:
+        with pytest.raises(ValueError, match="TimeStatus"):
+            OCMFTimestamp.from_string("2023-06-15T14:30:45,123+0200 Q")
+
+    def test_roundtrip(self) -> None:
+        value = "2023-06-15T14:30:45,123+0200 S"
+        assert str(OCMFTimestamp.from_string(value)) == value
+
+    def test_variable_width_input_serializes_in_spec_format(self) -> None:
+        ts = OCMFTimestamp.from_string("2023-06-15T14:30:45.123+02:00 I")
+        assert str(ts) == "2023-06-15T14:30:45,123+0200 I"
+
+    def test_parsed_equals_constructed(self) -> None:
+        ts = OCMFTimestamp.from_string("2023-06-15T14:30:45,123+0000 S")
+        constructed = OCMFTimestamp(
+            timestamp=datetime.datetime(2023, 6, 15, 14, 30, 45, 123000, tzinfo=datetime.UTC),
+            status=TimeStatus.SYNCHRONIZED,
+        )
+        assert ts == constructed
+        assert hash(ts) == hash(constructed)
+
+    def test_serializes_constructed_timestamp(self) -> None:
+        ts = OCMFTimestamp(
+            timestamp=datetime.datetime(
+                2023,
+                6,
+                15,
+                14,
+                30,
+                45,
+                123456,
+                tzinfo=datetime.timezone(-datetime.timedelta(hours=5, minutes=30)),
+            ),
+            status=TimeStatus.SYNCHRONIZED,
+        )
+        assert str(ts) == "2023-06-15T14:30:45,123-0530 S"
+
+    def test_repeated_parse_is_cached(self) -> None:
+        value = "2023-06-15T14:30:45,123+0200 S"
+        assert OCMFTimestamp.from_string(value) is OCMFTimestamp.from_string(value)
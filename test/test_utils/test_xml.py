@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import pathlib
+
+import pytest
+
+from pyocmf.crypto.availability import CRYPTOGRAPHY_AVAILABLE
+from pyocmf.exceptions import (
+    DataNotFoundError,
+    OcmfPayloadError,
+    SignatureVerificationError,
+    XmlParsingError,
+)
+from pyocmf.utils.xml import OcmfContainer
+
+from ..helpers import VALID_OCMF_STRING
+
+
+def _write_xml(path: pathlib.Path, *ocmf_strings: str) -> pathlib.Path:
+    values = "".join(
+        f'<value><signedData format="OCMF">{ocmf}</signedData></value>' for ocmf in ocmf_strings
+    )
+    path.write_text(f"<values>{values}</values>", encoding="utf-8")
+    return path
+
+
+class TestFromXml:
+    def test_parses_signed_data(self, tmp_path: pathlib.Path) -> None:
+        xml_file = _write_xml(tmp_path / "single.xml", VALID_OCMF_STRING)
+        container = OcmfContainer.from_xml(xml_file)
+        assert len(container) == 1
+        assert container[0].ocmf.payload.GS == "808829900001"
+
+    def test_unvalidated_parse_matches_validated(self, tmp_path: pathlib.Path) -> None:
+        xml_file = _write_xml(tmp_path / "trusted.xml", VALID_OCMF_STRING)
+        trusted = OcmfContainer.from_xml(xml_file, validate=False)
+        assert trusted[0].ocmf == OcmfContainer.from_xml(xml_file)[0].ocmf
+
+    @pytest.mark.parametrize("validate", [True, False])
+    def test_malformed_record_raises_payload_error(
+        self, tmp_path: pathlib.Path, validate: bool
+    ) -> None:
+        malformed = VALID_OCMF_STRING.replace('"RV":2965.1', '"RV":"lots"')
+        xml_file = _write_xml(tmp_path / f"malformed-{validate}.xml", malformed)
+        with pytest.raises(OcmfPayloadError):
+            OcmfContainer.from_xml(xml_file, validate=validate)
+
+    def test_duplicate_entries_are_skipped(self, tmp_path: pathlib.Path) -> None:
+        xml_file = _write_xml(tmp_path / "duplicate.xml", VALID_OCMF_STRING, VALID_OCMF_STRING)
+        assert len(OcmfContainer.from_xml(xml_file)) == 1
+
+    def test_nested_value_elements_are_ignored(self, tmp_path: pathlib.Path) -> None:
+        xml_file = tmp_path / "nested.xml"
+        xml_file.write_text(
+            f'<values><group><value><signedData format="OCMF">{VALID_OCMF_STRING}'
+            "</signedData></value></group></values>",
+            encoding="utf-8",
+        )
+        with pytest.raises(DataNotFoundError):
+            OcmfContainer.from_xml(xml_file)
+
+    def test_malformed_xml_raises(self, tmp_path: pathlib.Path) -> None:
+        xml_file = tmp_path / "broken.xml"
+        xml_file.write_text("<values><value>", encoding="utf-8")
+        with pytest.raises(XmlParsingError):
+            OcmfContainer.from_xml(xml_file)
+
+
+@pytest.mark.skipif(not CRYPTOGRAPHY_AVAILABLE, reason="cryptography package not installed")
+class TestVerifySignatures:
+    def test_results_follow_entry_order(
+        self,
+        tmp_path: pathlib.Path,
+        keba_ocmf_string: str,
+        keba_ocmf_string_tampered: str,
+        keba_public_key: str,
+    ) -> None:
+        values = "".join(
+            f'<value><signedData format="OCMF">{ocmf}</signedData>'
+            f"<publicKey>{keba_public_key}</publicKey></value>"
+            for ocmf in (keba_ocmf_string, keba_ocmf_string_tampered)
+        )
+        xml_file = tmp_path / "signed.xml"
+        xml_file.write_text(f"<values>{values}</values>", encoding="utf-8")
+
+        container = OcmfContainer.from_xml(xml_file)
+
+        assert container.verify_signatures(max_workers=2) == [True, False]
+
+    def test_entry_without_public_key_raises(self, tmp_path: pathlib.Path) -> None:
+        container = OcmfContainer.from_xml(_write_xml(tmp_path / "nokey.xml", VALID_OCMF_STRING))
+        with pytest.raises(SignatureVerificationError, match="No public key"):
+            container.verify_signatures()